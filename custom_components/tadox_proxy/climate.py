@@ -154,7 +154,9 @@ class TadoXProxyClimate(RegulationMixin, PresetMixin, CoordinatorEntity, Climate
         self._boost_saved_temp: float | None = None
         self._boost_end_ts: float = 0.0
 
-        # Timing
+        # Timing (timestamps are time.monotonic() seconds; 0.0 = never.  The
+        # monotonic origin is undefined, so elapsed-time checks must treat
+        # 0.0 as "infinitely long ago" rather than computing now - 0.0)
         self._regulation_lock = asyncio.Lock()
         self._last_regulation_ts = 0.0
         self._last_command_sent_ts = 0.0
@@ -190,47 +192,51 @@ class TadoXProxyClimate(RegulationMixin, PresetMixin, CoordinatorEntity, Climate
     @staticmethod
     def _build_config(entry: ConfigEntry) -> RegulationConfig:
         """Build regulation config, applying options over defaults."""
-        config = RegulationConfig()
+        defaults = RegulationConfig()
         opts = entry.options
-        if opts:
-            kp = opts.get(CONF_CORRECTION_KP, config.tuning.kp)
-            ki = opts.get(CONF_CORRECTION_KI, config.tuning.ki)
-            config.tuning = CorrectionTuning(kp=kp, ki=ki)
-            config.presets = PresetConfig(
-                eco_target_c=opts.get(CONF_ECO_TARGET, config.presets.eco_target_c),
-                boost_target_c=opts.get(CONF_BOOST_TARGET, config.presets.boost_target_c),
-                boost_duration_min=opts.get(CONF_BOOST_DURATION, config.presets.boost_duration_min),
-                away_target_c=opts.get(CONF_AWAY_TARGET, config.presets.away_target_c),
-                frost_protection_target_c=opts.get(CONF_FROST_PROTECTION_TARGET, config.presets.frost_protection_target_c),
-            )
+        if not opts:
+            return defaults
+        presets = PresetConfig(
+            eco_target_c=opts.get(CONF_ECO_TARGET, defaults.presets.eco_target_c),
+            boost_target_c=opts.get(CONF_BOOST_TARGET, defaults.presets.boost_target_c),
+            boost_duration_min=opts.get(CONF_BOOST_DURATION, defaults.presets.boost_duration_min),
+            away_target_c=opts.get(CONF_AWAY_TARGET, defaults.presets.away_target_c),
+            frost_protection_target_c=opts.get(CONF_FROST_PROTECTION_TARGET, defaults.presets.frost_protection_target_c),
+        )
+        return RegulationConfig(
+            tuning=CorrectionTuning(
+                kp=opts.get(CONF_CORRECTION_KP, defaults.tuning.kp),
+                ki=opts.get(CONF_CORRECTION_KI, defaults.tuning.ki),
+            ),
+            presets=presets,
             # Ensure max_target_c is at least as high as boost_target_c
-            config.max_target_c = max(config.max_target_c, config.presets.boost_target_c)
+            max_target_c=max(defaults.max_target_c, presets.boost_target_c),
             # Adaptive gain scheduling
-            config.gain_scheduling_enabled = opts.get(
-                CONF_GAIN_SCHEDULING, config.gain_scheduling_enabled
-            )
-            config.gain_fine_multiplier = opts.get(
-                CONF_GAIN_FINE_MULTIPLIER, config.gain_fine_multiplier
-            )
-            config.gain_startup_multiplier = opts.get(
-                CONF_GAIN_STARTUP_MULTIPLIER, config.gain_startup_multiplier
-            )
-            config.gain_startup_threshold_c = opts.get(
-                CONF_GAIN_STARTUP_THRESHOLD_C, config.gain_startup_threshold_c
-            )
-            config.gain_fine_threshold_c = opts.get(
-                CONF_GAIN_FINE_THRESHOLD_C, config.gain_fine_threshold_c
-            )
-            config.min_command_interval_s = opts.get(
-                CONF_MIN_COMMAND_INTERVAL_S, config.min_command_interval_s
-            )
-            config.min_change_threshold_c = opts.get(
-                CONF_MIN_CHANGE_THRESHOLD_C, config.min_change_threshold_c
-            )
-            config.integral_deadband_c = opts.get(
-                CONF_INTEGRAL_DEADBAND_C, config.integral_deadband_c
-            )
-        return config
+            gain_scheduling_enabled=opts.get(
+                CONF_GAIN_SCHEDULING, defaults.gain_scheduling_enabled
+            ),
+            gain_fine_multiplier=opts.get(
+                CONF_GAIN_FINE_MULTIPLIER, defaults.gain_fine_multiplier
+            ),
+            gain_startup_multiplier=opts.get(
+                CONF_GAIN_STARTUP_MULTIPLIER, defaults.gain_startup_multiplier
+            ),
+            gain_startup_threshold_c=opts.get(
+                CONF_GAIN_STARTUP_THRESHOLD_C, defaults.gain_startup_threshold_c
+            ),
+            gain_fine_threshold_c=opts.get(
+                CONF_GAIN_FINE_THRESHOLD_C, defaults.gain_fine_threshold_c
+            ),
+            min_command_interval_s=opts.get(
+                CONF_MIN_COMMAND_INTERVAL_S, defaults.min_command_interval_s
+            ),
+            min_change_threshold_c=opts.get(
+                CONF_MIN_CHANGE_THRESHOLD_C, defaults.min_change_threshold_c
+            ),
+            integral_deadband_c=opts.get(
+                CONF_INTEGRAL_DEADBAND_C, defaults.integral_deadband_c
+            ),
+        )
 
     @staticmethod
     def _build_behaviour(entry: ConfigEntry) -> BehaviourConfig:
@@ -451,6 +457,7 @@ class TadoXProxyClimate(RegulationMixin, PresetMixin, CoordinatorEntity, Climate
             last_sent_ts=self._last_command_sent_ts,
             threshold_c=self._behaviour.follow_threshold_c,
             grace_s=self._behaviour.follow_grace_s,
+            now=time.monotonic(),
         ):
             return
 
@@ -27,7 +27,7 @@ _CancelFn = Callable[[], None]
 _CallLaterFn = Callable[[Any, float, Callable], _CancelFn]
 
 
-@dataclass
+@dataclass(slots=True)
 class SavedState:
     """Snapshot of preset and temperature for later restoration."""
 
@@ -53,6 +53,8 @@ class WindowAutomationController:
                               idle
     """
 
+    __slots__ = ("is_active", "_open_timer", "_close_timer", "_saved")
+
     def __init__(self) -> None:
         self.is_active: bool = False
         self._open_timer: _CancelFn | None = None
@@ -191,6 +193,8 @@ class PresenceAutomationController:
           └───────────────────────────────────────────────────────────────────────────────────────┘
     """
 
+    __slots__ = ("is_active", "_away_timer", "_home_timer", "_saved")
+
     def __init__(self) -> None:
         self.is_active: bool = False
         self._away_timer: _CancelFn | None = None
@@ -332,14 +336,20 @@ class FollowPhysicalController:
         - The new setpoint is within ``threshold_c`` of our last command.
         - We are within ``grace_s`` of our last command (Tado still
           acknowledging via Thread/cloud).
+
+        ``last_sent_ts`` and ``now`` are ``time.monotonic()`` seconds;
+        ``last_sent_ts == 0.0`` means nothing has been sent yet, in which
+        case the grace check is skipped (the monotonic origin is undefined,
+        so ``now - 0.0`` may be small right after boot).
         """
         if last_sent is None:
             return False
         if abs(tado_setpoint - last_sent) <= threshold_c:
             return False
-        _now = now if now is not None else time.time()
-        if _now - last_sent_ts < grace_s:
-            return False
+        if last_sent_ts > 0:
+            _now = now if now is not None else time.monotonic()
+            if _now - last_sent_ts < grace_s:
+                return False
         return True
 
 
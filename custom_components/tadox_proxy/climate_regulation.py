@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
 
 from homeassistant.components.climate import HVACMode
@@ -37,6 +38,10 @@ class RegulationMixin:
     async def _async_regulation_cycle_locked(self, trigger: str) -> None:
         """Inner regulation cycle body, protected by _regulation_lock."""
         now = time.time()
+        # Cycle spacing and rate limiting use the monotonic clock so a
+        # wall-clock jump (e.g. NTP sync on an RTC-less host) cannot stall
+        # commands or produce a negative time delta.
+        now_mono = time.monotonic()
 
         # Guard: skip when HVAC is OFF – the TRV has been turned off directly,
         # no regulation needed.
@@ -91,8 +96,8 @@ class RegulationMixin:
             return
 
         # 2. Time delta
-        dt = (now - self._last_regulation_ts) if self._last_regulation_ts > 0 else 0.0
-        self._last_regulation_ts = now
+        dt = (now_mono - self._last_regulation_ts) if self._last_regulation_ts > 0 else 0.0
+        self._last_regulation_ts = now_mono
 
         # 3. Effective setpoint (considers HVAC mode + preset)
         setpoint = self._effective_setpoint()
@@ -121,20 +126,29 @@ class RegulationMixin:
             if self._last_sent_setpoint is not None
             else self.coordinator.data.get("tado_setpoint")  # None if Tado is off/unavailable
         )
-        time_since_last = now - self._last_command_sent_ts
-        is_rate_limited = time_since_last < self._config.min_command_interval_s
+        # _last_command_sent_ts == 0.0 means "never sent".  The monotonic
+        # clock's origin is undefined (host uptime on Linux), so
+        # now_mono - 0.0 can be below min_command_interval_s shortly after
+        # boot; treat "never sent" as infinitely long ago instead.
+        min_interval_s = self._config.min_command_interval_s
+        time_since_last = (
+            now_mono - self._last_command_sent_ts
+            if self._last_command_sent_ts > 0
+            else math.inf
+        )
+        is_rate_limited = time_since_last < min_interval_s
 
         should_send = False
         reason = "noop"
 
         if current_tado_setpoint is None:
             # No known Tado baseline – send to establish one.
-            # On the very first attempt (_last_command_sent_ts == 0) we send
+            # On the very first attempt (nothing sent yet) we send
             # immediately.  On subsequent retries (e.g. after a failed send)
             # we honour the rate limiter so a transient TRV/backend outage
             # does not cause command spam every regulation cycle.
-            if is_rate_limited and self._last_command_sent_ts > 0:
-                remaining = int(self._config.min_command_interval_s - time_since_last)
+            if is_rate_limited:
+                remaining = int(min_interval_s - time_since_last)
                 reason = f"rate_limited({remaining}s)"
             else:
                 should_send = True
@@ -142,18 +156,15 @@ class RegulationMixin:
         else:
             diff = abs(result.target_for_tado_c - current_tado_setpoint)
 
-            # Overlay refresh: resend the same setpoint if overlay_refresh_s has
-            # elapsed, keeping timer-based overlays alive (cloud-API integrations).
-            overlay_refresh_due = (
-                self._overlay_refresh_s > 0
-                and time_since_last >= self._overlay_refresh_s
-            )
-
-            if diff < self._config.min_change_threshold_c and not overlay_refresh_due:
-                reason = "already_at_target"
-            elif diff < self._config.min_change_threshold_c and overlay_refresh_due:
-                should_send = True
-                reason = "overlay_refresh"
+            if diff < self._config.min_change_threshold_c:
+                # Overlay refresh: resend the same setpoint if overlay_refresh_s
+                # has elapsed, keeping timer-based overlays alive (cloud-API
+                # integrations).
+                if self._overlay_refresh_s > 0 and time_since_last >= self._overlay_refresh_s:
+                    should_send = True
+                    reason = "overlay_refresh"
+                else:
+                    reason = "already_at_target"
             elif is_rate_limited:
                 is_urgent_decrease = (
                     result.target_for_tado_c
@@ -163,7 +174,7 @@ class RegulationMixin:
                     should_send = True
                     reason = "urgent_decrease"
                 else:
-                    remaining = int(self._config.min_command_interval_s - time_since_last)
+                    remaining = int(min_interval_s - time_since_last)
                     reason = f"rate_limited({remaining}s)"
             else:
                 should_send = True
@@ -172,7 +183,7 @@ class RegulationMixin:
         # 6. Send command to Tado
         if should_send:
             await self._async_send_to_tado(result.target_for_tado_c)
-            self._last_command_sent_ts = now
+            self._last_command_sent_ts = now_mono
             self._last_reason = f"sent({reason})"
         else:
             self._last_reason = reason
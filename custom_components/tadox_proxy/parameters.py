@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 # Behavioural thresholds (climate-entity logic, independent of the PI engine)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BehaviourConfig:
     """Thresholds for the follow-Tado and send-decision logic.
 
@@ -42,7 +42,7 @@ DEFAULT_SENSOR_GRACE_S: int = 300      # seconds to use last-valid room_temp whe
 # Correction tuning  (PI layer on top of feedforward)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CorrectionTuning:
     """PI correction parameters applied on top of the feedforward offset.
 
@@ -73,9 +73,13 @@ class PresetConfig:
 # Full regulation config with safety rails
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegulationConfig:
-    """All regulation parameters and safety limits."""
+    """All regulation parameters and safety limits.
+
+    Frozen: the regulator reads it every cycle, so a config is built once
+    from defaults + options and replaced as a whole when options change.
+    """
 
     tuning: CorrectionTuning = field(default_factory=CorrectionTuning)
     presets: PresetConfig = field(default_factory=PresetConfig)
@@ -109,3 +113,17 @@ class RegulationConfig:
     gain_fine_multiplier: float = 1.0      # Kp multiplier when |error| < fine_threshold
     gain_startup_threshold_c: float = 2.0  # error threshold for startup (aggressive) zone
     gain_fine_threshold_c: float = 0.5     # error threshold for fine (gentle) zone
+
+    # Derived in __post_init__: Kp multiplier change per °C of |error| inside
+    # the interpolation zone between the fine and startup thresholds.
+    gain_slope_per_c: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the gain-scheduling slope (constant for a frozen config)."""
+        span = self.gain_startup_threshold_c - self.gain_fine_threshold_c
+        slope = (
+            (self.gain_startup_multiplier - self.gain_fine_multiplier) / span
+            if span > 0
+            else 0.0
+        )
+        object.__setattr__(self, "gain_slope_per_c", slope)
@@ -26,6 +26,7 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
+from typing import NamedTuple
 
 from .parameters import RegulationConfig
 
@@ -36,20 +37,36 @@ _LOGGER = logging.getLogger(__name__)
 _SATURATION_TOLERANCE_C = 0.01
 
 
+def _clamp(value: float, lo: float, hi: float) -> float:
+    """Clamp *value* to ``[lo, hi]`` without the ``max``/``min`` call overhead.
+
+    Matches ``max(lo, min(hi, value))`` exactly, including NaN → ``hi``, so
+    a non-finite intermediate never reaches Tado as the target.
+    """
+    return lo if value < lo else value if value <= hi else hi
+
+
 # ---------------------------------------------------------------------------
 # State & result data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RegulationState:
-    """Mutable state carried between regulation cycles."""
+    """Mutable state carried between regulation cycles.
+
+    ``compute`` updates the instance in place and hands the same object back
+    as ``RegulationResult.new_state``.
+    """
 
     integral_c: float = 0.0
 
 
-@dataclass
-class RegulationResult:
-    """Output of a single regulation cycle."""
+class RegulationResult(NamedTuple):
+    """Output of a single regulation cycle.
+
+    A ``NamedTuple`` rather than a dataclass: it is built once per cycle and
+    only read afterwards, so the cheaper tuple construction is sufficient.
+    """
 
     target_for_tado_c: float       # absolute temperature to send to Tado
     feedforward_offset_c: float    # measured sensor offset  (diagnostic)
@@ -67,6 +84,8 @@ class RegulationResult:
 class FeedforwardPiRegulator:
     """Feedforward + PI regulator for Tado X proxy thermostats."""
 
+    __slots__ = ("cfg",)
+
     def __init__(self, config: RegulationConfig) -> None:
         self.cfg = config
 
@@ -89,9 +108,10 @@ class FeedforwardPiRegulator:
             multiplier = config.gain_fine_multiplier
         else:
             # Linear interpolation between fine and startup multiplier
-            span = config.gain_startup_threshold_c - config.gain_fine_threshold_c
-            t = (abs_error - config.gain_fine_threshold_c) / span
-            multiplier = config.gain_fine_multiplier + t * (config.gain_startup_multiplier - config.gain_fine_multiplier)
+            multiplier = (
+                config.gain_fine_multiplier
+                + (abs_error - config.gain_fine_threshold_c) * config.gain_slope_per_c
+            )
 
         return config.tuning.kp * multiplier
 
@@ -116,8 +136,13 @@ class FeedforwardPiRegulator:
         time_delta_s:
             Seconds elapsed since the last cycle (0.0 on the very first run).
         state:
-            Previous regulation state (integral accumulator, etc.).
+            Previous regulation state (integral accumulator, etc.).  Updated
+            in place; the same object is returned as ``new_state``.
         """
+        # Bind config once; the limits are read several times per cycle.
+        cfg = self.cfg
+        min_target = cfg.min_target_c
+        max_target = cfg.max_target_c
 
         # 0. Guard: reject NaN/Inf inputs – they would corrupt all calculations
         for label, value in (
@@ -131,9 +156,9 @@ class FeedforwardPiRegulator:
                     label, value,
                 )
                 safe_target = (
-                    max(self.cfg.min_target_c, min(self.cfg.max_target_c, setpoint_c))
+                    _clamp(setpoint_c, min_target, max_target)
                     if math.isfinite(setpoint_c)
-                    else self.cfg.min_target_c
+                    else min_target
                 )
                 return RegulationResult(
                     target_for_tado_c=safe_target,
@@ -152,7 +177,7 @@ class FeedforwardPiRegulator:
         error = setpoint_c - room_temp_c
 
         # 3. Proportional correction (adaptive gain scheduling)
-        effective_kp = self._effective_kp(error, self.cfg)
+        effective_kp = self._effective_kp(error, cfg)
         p_correction = effective_kp * error
 
         # 4. Integral correction (carried from previous cycles)
@@ -163,17 +188,14 @@ class FeedforwardPiRegulator:
         raw_command = base_target + p_correction + i_correction
 
         # 6. Clamp to safe actuator range
-        final_command = max(
-            self.cfg.min_target_c,
-            min(self.cfg.max_target_c, raw_command),
-        )
+        final_command = _clamp(raw_command, min_target, max_target)
         is_saturated = abs(final_command - raw_command) > _SATURATION_TOLERANCE_C
 
         # 7. Anti-windup (two mechanisms)
         new_integral = state.integral_c
         if time_delta_s > 0:
-            saturated_high = raw_command > self.cfg.max_target_c
-            saturated_low = raw_command < self.cfg.min_target_c
+            saturated_high = raw_command > max_target
+            saturated_low = raw_command < min_target
 
             # Mechanism A: block integration during output saturation
             may_integrate = True
@@ -183,23 +205,20 @@ class FeedforwardPiRegulator:
                 may_integrate = False
 
             # Mechanism B: only accumulate near target, decay otherwise
-            near_target = abs(error) < self.cfg.integral_deadband_c
+            near_target = abs(error) < cfg.integral_deadband_c
 
             if may_integrate and near_target:
                 # Near target → accumulate integral for steady-state accuracy
-                new_integral += error * self.cfg.tuning.ki * time_delta_s
-                new_integral = max(
-                    self.cfg.integral_min_c,
-                    min(self.cfg.integral_max_c, new_integral),
+                new_integral += error * cfg.tuning.ki * time_delta_s
+                new_integral = _clamp(
+                    new_integral, cfg.integral_min_c, cfg.integral_max_c
                 )
             elif not near_target:
                 # Far from target → decay integral to prevent overshoot
-                new_integral *= self.cfg.integral_decay
+                new_integral *= cfg.integral_decay
 
-        # 8. Build result
-        new_state = RegulationState(
-            integral_c=new_integral,
-        )
+        # 8. Update state in place and build result
+        state.integral_c = new_integral
 
         return RegulationResult(
             target_for_tado_c=round(final_command, 1),
@@ -208,5 +227,5 @@ class FeedforwardPiRegulator:
             i_correction_c=round(new_integral, 2),
             error_c=round(error, 2),
             is_saturated=is_saturated,
-            new_state=new_state,
+            new_state=state,
         )
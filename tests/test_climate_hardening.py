@@ -158,27 +158,26 @@ def _rate_limit_decision(
     This mirrors the fixed code exactly – the test would have FAILED with the
     old code that used 0.0 as the fallback.
     """
-    time_since_last = now - last_command_sent_ts
-    is_rate_limited = time_since_last < config.min_command_interval_s
+    min_interval_s = config.min_command_interval_s
+    time_since_last = (
+        now - last_command_sent_ts if last_command_sent_ts > 0 else math.inf
+    )
+    is_rate_limited = time_since_last < min_interval_s
 
     if current_tado_setpoint is None:
         # No baseline: send to establish one, but honour the rate limiter
         # after the first attempt so a transient outage does not cause spam.
-        if is_rate_limited and last_command_sent_ts > 0:
-            remaining = int(config.min_command_interval_s - time_since_last)
+        if is_rate_limited:
+            remaining = int(min_interval_s - time_since_last)
             return False, f"rate_limited({remaining}s)"
         return True, "no_baseline"
 
     diff = abs(target_c - current_tado_setpoint)
 
-    overlay_refresh_due = (
-        overlay_refresh_s > 0 and time_since_last >= overlay_refresh_s
-    )
-
-    if diff < config.min_change_threshold_c and not overlay_refresh_due:
+    if diff < config.min_change_threshold_c:
+        if overlay_refresh_s > 0 and time_since_last >= overlay_refresh_s:
+            return True, "overlay_refresh"
         return False, "already_at_target"
-    elif diff < config.min_change_threshold_c and overlay_refresh_due:
-        return True, "overlay_refresh"
     elif is_rate_limited:
         is_urgent_decrease = (
             target_c < current_tado_setpoint - behaviour.urgent_decrease_threshold_c
@@ -186,7 +185,7 @@ def _rate_limit_decision(
         if is_urgent_decrease:
             return True, "urgent_decrease"
         else:
-            remaining = int(config.min_command_interval_s - time_since_last)
+            remaining = int(min_interval_s - time_since_last)
             return False, f"rate_limited({remaining}s)"
     else:
         return True, "normal_update"
@@ -353,6 +352,64 @@ class TestRateLimiterNoBaseline:
         )
         assert s3 is True and r3 == "no_baseline"
 
+    # --- monotonic clock: small "now" right after host boot ---
+
+    def test_known_baseline_never_sent_not_rate_limited_after_boot(self):
+        """Startup-seeded baseline, nothing sent yet, host up < min interval.
+
+        time.monotonic() may be ~uptime, so now - 0.0 < 180 s; the first real
+        correction must still go out instead of a bogus rate_limited(...).
+        """
+        should_send, reason = _rate_limit_decision(
+            target_c=21.8,
+            current_tado_setpoint=21.0,
+            last_command_sent_ts=0.0,
+            now=95.0,
+            config=self.config,
+            behaviour=self.behaviour,
+        )
+        assert should_send is True
+        assert reason == "normal_update"
+
+    def test_overlay_refresh_due_when_never_sent_after_boot(self):
+        """Never sent counts as infinitely long ago for the overlay refresh too."""
+        should_send, reason = _rate_limit_decision(
+            target_c=21.0,
+            current_tado_setpoint=21.0,
+            last_command_sent_ts=0.0,
+            now=95.0,
+            config=self.config,
+            behaviour=self.behaviour,
+            overlay_refresh_s=900,
+        )
+        assert should_send is True
+        assert reason == "overlay_refresh"
+
+    def test_no_baseline_never_sent_sends_after_boot(self):
+        should_send, reason = _rate_limit_decision(
+            target_c=20.0,
+            current_tado_setpoint=None,
+            last_command_sent_ts=0.0,
+            now=95.0,
+            config=self.config,
+            behaviour=self.behaviour,
+        )
+        assert should_send is True
+        assert reason == "no_baseline"
+
+    def test_small_monotonic_timestamps_still_rate_limit(self):
+        """A real send shortly after boot is rate-limited as usual."""
+        should_send, reason = _rate_limit_decision(
+            target_c=21.8,
+            current_tado_setpoint=21.0,
+            last_command_sent_ts=95.0,
+            now=155.0,
+            config=self.config,
+            behaviour=self.behaviour,
+        )
+        assert should_send is False
+        assert reason == "rate_limited(120s)"
+
 
 # ---------------------------------------------------------------------------
 # Bug 2: NaN/Inf rejection in preset number entity
@@ -679,7 +679,7 @@ class TestFollowPhysicalController:
     # --- grace period ---
 
     def test_within_grace_returns_false(self):
-        now = time.time()
+        now = time.monotonic()
         assert not self._call(
             tado_setpoint=21.0,
             last_sent=20.0,
@@ -735,17 +735,41 @@ class TestFollowPhysicalController:
             now=1000.0,
         )
 
-    # --- now defaults to time.time() ---
+    # --- monotonic clock: nothing sent yet ---
 
-    def test_now_defaults_to_current_time(self):
-        """Without explicit now, should_follow uses time.time(); old command → True."""
+    def test_never_sent_skips_grace_after_boot(self):
+        """Startup-seeded baseline, nothing sent, monotonic now < grace_s → follow."""
         assert self._call(
+            tado_setpoint=23.0,
+            last_sent=20.0,
+            last_sent_ts=0.0,
+            threshold_c=0.5,
+            grace_s=20.0,
+            now=15.0,
+        )
+
+    def test_small_monotonic_timestamps_still_honour_grace(self):
+        """A real send shortly after boot still gets its grace period."""
+        assert not self._call(
+            tado_setpoint=23.0,
+            last_sent=20.0,
+            last_sent_ts=10.0,
+            threshold_c=0.5,
+            grace_s=20.0,
+            now=15.0,
+        )
+
+    # --- now defaults to time.monotonic() ---
+
+    def test_now_defaults_to_monotonic_clock(self):
+        """Without explicit now, should_follow uses time.monotonic()."""
+        assert not self._call(
             tado_setpoint=22.0,
             last_sent=20.0,
-            last_sent_ts=0.0,  # very old → well past grace
+            last_sent_ts=time.monotonic() - 5,  # 5 s ago → within grace
             threshold_c=0.5,
             grace_s=20.0,
-            # no 'now' → uses time.time()
+            # no 'now' → uses time.monotonic()
         )
 
 
@@ -4,6 +4,7 @@ These tests validate the pure regulation logic without requiring
 Home Assistant to be installed.  We import the modules directly
 to avoid triggering the HA-dependent __init__.py.
 """
+import dataclasses
 import importlib
 import os
 import sys
@@ -226,6 +227,22 @@ class TestPiCorrection:
 
         assert result.i_correction_c == 0.0
 
+    def test_state_updated_in_place(self):
+        """compute() should mutate and return the caller's state object."""
+        reg = make_regulator()
+        state = RegulationState()
+
+        result = reg.compute(
+            setpoint_c=21.0,
+            room_temp_c=20.8,
+            tado_internal_c=22.0,
+            time_delta_s=60.0,
+            state=state,
+        )
+
+        assert result.new_state is state
+        assert state.integral_c == pytest.approx(0.2 * 0.003 * 60)
+
 
 # -----------------------------------------------------------------------
 # Anti-windup
@@ -331,6 +348,18 @@ class TestSafetyClamping:
 
         assert result.target_for_tado_c >= 5.0
 
+    def test_clamp_helper_bounds(self):
+        """_clamp should pass in-range values through and pin the rest."""
+        assert _reg._clamp(21.0, 5.0, 30.0) == 21.0
+        assert _reg._clamp(2.0, 5.0, 30.0) == 5.0
+        assert _reg._clamp(35.0, 5.0, 30.0) == 30.0
+        assert _reg._clamp(5.0, 5.0, 30.0) == 5.0
+
+    def test_clamp_helper_nan_matches_max_min(self):
+        """NaN is pinned to hi, exactly like max(lo, min(hi, nan))."""
+        nan = float("nan")
+        assert _reg._clamp(nan, 5.0, 30.0) == max(5.0, min(30.0, nan)) == 30.0
+
 
 # -----------------------------------------------------------------------
 # Full scenario: cold start to steady state
@@ -902,6 +931,34 @@ class TestAdaptiveGainScheduling:
         kp_at_startup = FeedforwardPiRegulator._effective_kp(2.0, config)
         assert kp_at_startup == pytest.approx(config.tuning.kp * 1.5, abs=0.001)
 
+    def test_slope_precomputed_from_config(self):
+        """gain_slope_per_c = (startup_mult - fine_mult) / (startup_thr - fine_thr)."""
+        config = RegulationConfig()
+        assert config.gain_slope_per_c == pytest.approx((1.5 - 1.0) / (2.0 - 0.5))
+
+    def test_equal_thresholds_do_not_divide_by_zero(self):
+        """An empty interpolation zone falls back to the fine multiplier."""
+        config = RegulationConfig(gain_fine_threshold_c=1.0, gain_startup_threshold_c=1.0)
+        assert config.gain_slope_per_c == 0.0
+        kp = FeedforwardPiRegulator._effective_kp(1.0, config)
+        assert kp == pytest.approx(config.tuning.kp * config.gain_fine_multiplier)
+
+
+# ---------------------------------------------------------------------------
+# RegulationConfig immutability
+# ---------------------------------------------------------------------------
+
+class TestRegulationConfig:
+    """RegulationConfig and CorrectionTuning are frozen (PresetConfig is not)."""
+
+    def test_config_is_frozen(self):
+        """RegulationConfig and its tuning are replaced, never mutated."""
+        cfg = RegulationConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.max_target_c = 25.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.tuning.kp = 1.0
+
 
 # ---------------------------------------------------------------------------
 # Temperature range limits